@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import os
-import pickle
 import json
 import msgpack
 from pathlib import Path
@@ -51,24 +50,29 @@ class LocalStorage(object):
         if not p.exists() and allow_missing:
             return None
         elif not p.exists() and not allow_missing:
-            raise KeyError(p + " not found in local storage")
+            raise KeyError(str(p) + " not found in local storage")
         return p
 
     def blob_path(self, key):
         return os.path.join(self.base_dir, key)
 
     def search(self, prefix="", suffix=""):
-        files = []
-        for root, dirs, files in os.walk(self.base_dir, topdown=False):
-            common_prefix_len = min(len(prefix), len(root))
-            if root[:common_prefix_len] != prefix[:common_prefix_len]:
-                continue
+        keys = []
+        # only walk the directories which can contain keys with the given prefix
+        search_dir = os.path.join(self.base_dir, os.path.dirname(prefix))
+        for root, dirs, files in os.walk(search_dir):
+            # os.walk() roots always start with base_dir, so stripping it is enough
+            root_key = util.trim_prefix(root, self.base_dir).lstrip("/")
+
+            dirs[:] = [
+                d for d in dirs if _could_contain_prefix(os.path.join(root_key, d) + "/", prefix)
+            ]
 
             for name in files:
-                filename = os.path.join(root, name)
-                if filename.startswith(prefix) and filename.endswith(suffix):
-                    files.append(filename)
-        return files
+                key = os.path.join(root_key, name)
+                if key.startswith(prefix) and key.endswith(suffix):
+                    keys.append(key)
+        return keys
 
     def _put_str(self, str_val, key):
         f = self._get_or_create_path(key)
@@ -121,3 +125,7 @@ class LocalStorage(object):
         local_zip = os.path.join(local_dir, "zip.zip")
         self.download_file(key, local_zip)
         util.extract_zip(local_zip, delete_zip_file=True)
+
+
+def _could_contain_prefix(dir_key, prefix):
+    return dir_key.startswith(prefix) or prefix.startswith(dir_key)
@@ -15,14 +15,23 @@
 import os
 import boto3
 import botocore
-import pickle
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
 import json
 import msgpack
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from cortex.lib import util
 from cortex.lib.exceptions import CortexException
 
+# number of files downloaded concurrently by download_dir_contents()
+DOWNLOAD_DIR_MAX_WORKERS = 4
+# number of concurrent (multipart) requests made by each download_file()
+DOWNLOAD_FILE_MAX_CONCURRENCY = 10
+# size the connection pool so that every concurrent request gets its own connection
+MAX_POOL_CONNECTIONS = DOWNLOAD_DIR_MAX_WORKERS * DOWNLOAD_FILE_MAX_CONCURRENCY
+
 
 class S3(object):
     def __init__(self, bucket=None, region=None, client_config={}):
@@ -31,17 +40,23 @@ class S3(object):
 
         if client_config is None:
             client_config = {}
+        client_config = dict(client_config)
 
         if region is not None:
             client_config["region_name"] = region
 
+        if "config" not in client_config:
+            client_config["config"] = Config(max_pool_connections=MAX_POOL_CONNECTIONS)
+
         self.s3 = boto3.client("s3", **client_config)
+        self.transfer_config = TransferConfig(max_concurrency=DOWNLOAD_FILE_MAX_CONCURRENCY)
 
     @staticmethod
     def deconstruct_s3_path(s3_path):
         path = util.trim_prefix(s3_path, "s3://")
-        bucket = path.split("/")[0]
-        key = os.path.join(*path.split("/")[1:])
+        bucket, _, key = path.partition("/")
+        # collapse empty path segments (e.g. "a//k" -> "a/k")
+        key = os.path.join(*key.split("/"))
         return (bucket, key)
 
     def blob_path(self, key):
@@ -58,7 +73,7 @@ class S3(object):
                 raise
 
     def _is_s3_prefix(self, prefix):
-        response = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
+        response = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix, MaxKeys=1)
         return response["KeyCount"] > 0
 
     def _is_s3_dir(self, dir_path):
@@ -77,7 +92,8 @@ class S3(object):
 
             for obj in contents:
                 key = obj["Key"]
-                if key.startswith(prefix) and key.endswith(suffix):
+                # keys returned by list_objects_v2() always start with the requested prefix
+                if key.endswith(suffix):
                     yield obj
 
             try:
@@ -170,7 +186,7 @@ class S3(object):
     def download_file(self, key, local_path):
         util.mkdir_p(os.path.dirname(local_path))
         try:
-            self.s3.download_file(self.bucket, key, local_path)
+            self.s3.download_file(self.bucket, key, local_path, Config=self.transfer_config)
             return local_path
         except Exception as e:
             raise CortexException(
@@ -179,18 +195,37 @@ class S3(object):
             ) from e
 
     def download_dir(self, prefix, local_dir):
-        dir_name = util.trim_suffix(prefix, "/").split("/")[-1]
+        dir_name = util.trim_suffix(prefix, "/").rpartition("/")[2]
         return self.download_dir_contents(prefix, os.path.join(local_dir, dir_name))
 
     def download_dir_contents(self, prefix, local_dir):
         util.mkdir_p(local_dir)
         prefix = util.ensure_suffix(prefix, "/")
-        for key in self._get_matching_s3_keys_generator(prefix):
-            if key.endswith("/"):
-                continue
-            rel_path = util.trim_prefix(key, prefix)
-            local_dest_path = os.path.join(local_dir, rel_path)
-            self.download_file(key, local_dest_path)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_DIR_MAX_WORKERS) as executor:
+            pending = set()
+            try:
+                for key in self._get_matching_s3_keys_generator(prefix):
+                    if key.endswith("/"):
+                        continue
+
+                    # keep a bounded number of downloads queued, so that keys are consumed as their
+                    # listing pages arrive rather than queueing the whole prefix
+                    if len(pending) >= 2 * DOWNLOAD_DIR_MAX_WORKERS:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+
+                    rel_path = util.trim_prefix(key, prefix)
+                    local_dest_path = os.path.join(local_dir, rel_path)
+                    pending.add(executor.submit(self.download_file, key, local_dest_path))
+
+                for future in pending:
+                    future.result()
+            except:
+                # don't start the queued downloads; only the ones already running are waited on
+                for future in pending:
+                    future.cancel()
+                raise
 
     def download_and_unzip(self, key, local_dir):
         util.mkdir_p(local_dir)
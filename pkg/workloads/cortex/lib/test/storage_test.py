@@ -0,0 +1,44 @@
+# Copyright 2020 Cortex Labs, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from cortex.lib.storage import S3, LocalStorage
+
+
+def test_deconstruct_s3_path():
+    assert S3.deconstruct_s3_path("s3://bucket/dir/key") == ("bucket", "dir/key")
+    assert S3.deconstruct_s3_path("s3://bucket/dir/") == ("bucket", "dir/")
+    assert S3.deconstruct_s3_path("s3://bucket/a//k") == ("bucket", "a/k")
+    assert S3.deconstruct_s3_path("s3://bucket//k") == ("bucket", "k")
+    assert S3.deconstruct_s3_path("s3://bucket") == ("bucket", "")
+    assert S3.deconstruct_s3_path("bucket/key") == ("bucket", "key")
+
+
+def test_local_storage_search(tmp_path):
+    for key in ["apis/ab/x", "apis/ab/y.json", "apis/b/z", "other/w", "top"]:
+        path = tmp_path / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    storage = LocalStorage(str(tmp_path))
+
+    assert sorted(storage.search()) == [
+        "apis/ab/x",
+        "apis/ab/y.json",
+        "apis/b/z",
+        "other/w",
+        "top",
+    ]
+    assert sorted(storage.search(prefix="apis/ab/")) == ["apis/ab/x", "apis/ab/y.json"]
+    assert sorted(storage.search(prefix="apis/a")) == ["apis/ab/x", "apis/ab/y.json"]
+    assert storage.search(prefix="missing/") == []
+    assert storage.search(prefix="apis/", suffix=".json") == ["apis/ab/y.json"]
@@ -42,3 +42,23 @@ def test_merge_dicts():
     util.merge_dicts_in_place_no_overwrite(dict1_copy, dict2)
     assert expected2 == dict1_copy
     assert dict1 != dict1_copy
+
+
+def test_merge_dicts_deeply_nested():
+    depth = 5000
+    dict1 = {}
+    dict2 = {}
+    inner1 = dict1
+    inner2 = dict2
+    for _ in range(depth):
+        inner1["k"] = {"v1": "v1"}
+        inner2["k"] = {"v1": "V1", "v2": "V2"}
+        inner1 = inner1["k"]
+        inner2 = inner2["k"]
+
+    util.merge_dicts_in_place_overwrite(dict1, dict2)
+    inner = dict1
+    for _ in range(depth):
+        assert inner["k"]["v1"] == "V1"
+        assert inner["k"]["v2"] == "V2"
+        inner = inner["k"]
@@ -53,7 +53,7 @@ class API:
         class_paths = self.storage.search(prefix=prefix)
         class_set = set()
         for class_path in class_paths:
-            encoded_class_name = class_path.split("/")[-1]
+            encoded_class_name = class_path.rpartition("/")[2]
             class_set.add(base64.urlsafe_b64decode(encoded_class_name.encode()).decode())
         return class_set
 
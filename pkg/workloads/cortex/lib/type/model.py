@@ -14,6 +14,8 @@
 
 
 class Model:
+    __slots__ = ("name", "model_path", "base_path", "signature_key")
+
     def __init__(self, name, model_path, base_path, signature_key=None):
         self.name = name
         self.model_path = model_path
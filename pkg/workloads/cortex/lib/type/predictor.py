@@ -20,7 +20,7 @@ import dill
 
 from cortex.lib.log import refresh_logger, cx_logger
 from cortex.lib.exceptions import CortexException, UserException, UserRuntimeException
-from cortex.lib.type.model import Model, get_model_signature_map
+from cortex.lib.type.model import Model
 from cortex import consts
 
 
@@ -98,15 +98,7 @@ class Predictor:
             refresh_logger()
 
     def class_impl(self, project_dir):
-        if self.type == "tensorflow":
-            target_class_name = "TensorFlowPredictor"
-            validations = TENSORFLOW_CLASS_VALIDATION
-        elif self.type == "onnx":
-            target_class_name = "ONNXPredictor"
-            validations = ONNX_CLASS_VALIDATION
-        elif self.type == "python":
-            target_class_name = "PythonPredictor"
-            validations = PYTHON_CLASS_VALIDATION
+        target_class_name, validations = PREDICTOR_CLASS_VALIDATIONS[self.type]
 
         try:
             impl = self._load_module("cortex_predictor", os.path.join(project_dir, self.path))
@@ -196,20 +188,22 @@ ONNX_CLASS_VALIDATION = {
     ]
 }
 
+PREDICTOR_CLASS_VALIDATIONS = {
+    "python": ("PythonPredictor", PYTHON_CLASS_VALIDATION),
+    "tensorflow": ("TensorFlowPredictor", TENSORFLOW_CLASS_VALIDATION),
+    "onnx": ("ONNXPredictor", ONNX_CLASS_VALIDATION),
+}
+
 
 def _validate_impl(impl, impl_req):
     for optional_func_signature in impl_req.get("optional", []):
-        _validate_optional_fn_args(impl, optional_func_signature)
+        if getattr(impl, optional_func_signature["name"], None):
+            _validate_required_fn_args(impl, optional_func_signature)
 
     for required_func_signature in impl_req.get("required", []):
         _validate_required_fn_args(impl, required_func_signature)
 
 
-def _validate_optional_fn_args(impl, func_signature):
-    if getattr(impl, func_signature["name"], None):
-        _validate_required_fn_args(impl, func_signature)
-
-
 def _validate_required_fn_args(impl, func_signature):
     fn = getattr(impl, func_signature["name"], None)
     if not fn:
@@ -236,9 +230,10 @@ def _validate_required_fn_args(impl, func_signature):
                     f'invalid signature for function "{fn_str}": "self" must be the first argument'
                 )
 
-    seen_args = []
+    supported_args = set(required_args) | set(optional_args)
+    seen_args = set()
     for arg_name in argspec.args:
-        if arg_name not in required_args and arg_name not in optional_args:
+        if arg_name not in supported_args:
             raise UserException(
                 f'invalid signature for function "{fn_str}": "{arg_name}" is not a supported argument'
             )
@@ -248,7 +243,7 @@ def _validate_required_fn_args(impl, func_signature):
                 f'invalid signature for function "{fn_str}": "{arg_name}" is duplicated'
             )
 
-        seen_args.append(arg_name)
+        seen_args.add(arg_name)
 
 
 def uses_neuron_savedmodel():
@@ -276,34 +271,35 @@ neuron_tf_expected_dir_structure = """neuron tensorflow model directories must h
 
 
 def validate_model_dir(model_dir):
-    version = None
-    for file_name in os.listdir(model_dir):
-        if file_name.isdigit():
-            version = file_name
-            break
-
-    if version is None:
+    version_entry = None
+    with os.scandir(model_dir) as entries:
+        for entry in entries:
+            if entry.name.isdigit():
+                version_entry = entry
+                break
+
+    # is_dir() uses the file type returned with the directory listing, avoiding a stat() call
+    if version_entry is None or not version_entry.is_dir():
         cx_logger().error(get_expected_dir_structure())
         raise UserException("no top-level version folder found")
 
-    if not os.path.isdir(os.path.join(model_dir, version)):
-        cx_logger().error(get_expected_dir_structure())
-        raise UserException("no top-level version folder found")
+    version_dir = version_entry.path
 
-    if not os.path.isfile(os.path.join(model_dir, version, "saved_model.pb")):
+    if not os.path.isfile(os.path.join(version_dir, "saved_model.pb")):
         cx_logger().error(get_expected_dir_structure())
         raise UserException('expected a "saved_model.pb" file')
 
     if not uses_neuron_savedmodel():
-        if not os.path.isdir(os.path.join(model_dir, version, "variables")):
+        variables_dir = os.path.join(version_dir, "variables")
+        if not os.path.isdir(variables_dir):
             cx_logger().error(tf_expected_dir_structure)
             raise UserException('expected a "variables" directory')
 
-        if not os.path.isfile(os.path.join(model_dir, version, "variables", "variables.index")):
+        if not os.path.isfile(os.path.join(variables_dir, "variables.index")):
             cx_logger().error(tf_expected_dir_structure)
             raise UserException('expected a "variables/variables.index" file')
 
-        for file_name in os.listdir(os.path.join(model_dir, version, "variables")):
+        for file_name in os.listdir(variables_dir):
             if file_name.startswith("variables.data-00000-of"):
                 return
 
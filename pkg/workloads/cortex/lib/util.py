@@ -15,7 +15,7 @@
 import os
 import shutil
 import json
-import collections
+import collections.abc
 import zipfile
 import pathlib
 import inspect
@@ -119,22 +119,36 @@ def merge_two_dicts_in_place_overwrite(x, y):
     if y is None:
         y = {}
 
-    for k, v in y.items():
-        if k in x and isinstance(x[k], dict) and isinstance(y[k], collections.Mapping):
-            merge_dicts_in_place_overwrite(x[k], y[k])
-        else:
-            x[k] = y[k]
+    # walk nested dicts with an explicit stack instead of recursing once per level
+    stack = [(x, y)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            if (
+                k in target
+                and isinstance(target[k], dict)
+                and isinstance(v, collections.abc.Mapping)
+            ):
+                stack.append((target[k], v))
+            else:
+                target[k] = v
     return x
 
 
 def merge_two_dicts_in_place_no_overwrite(x, y):
     """Merge y into x, without overwriting. x is updated in place"""
-    for k, v in y.items():
-        if k in x and isinstance(x[k], dict) and isinstance(y[k], collections.Mapping):
-            merge_dicts_in_place_no_overwrite(x[k], y[k])
-        else:
-            if k not in x:
-                x[k] = y[k]
+    stack = [(x, y)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            if (
+                k in target
+                and isinstance(target[k], dict)
+                and isinstance(v, collections.abc.Mapping)
+            ):
+                stack.append((target[k], v))
+            elif k not in target:
+                target[k] = v
     return x
 
 